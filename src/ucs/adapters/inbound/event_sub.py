@@ -15,17 +15,22 @@
 
 """Receive events informing about files that are expected to be uploaded."""
 
+from collections.abc import Awaitable, Callable
+
 from ghga_event_schemas import pydantic_ as event_schemas
 from ghga_event_schemas.validation import get_validated_payload
 from hexkit.custom_types import Ascii, JsonObject
 from hexkit.protocols.eventsub import EventSubscriberProtocol
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 from pydantic_settings import BaseSettings
 
 from ucs.core import models
 from ucs.ports.inbound.file_service import FileMetadataServicePort
 from ucs.ports.inbound.upload_service import UploadServicePort
 
+# converts the files of a metadata submission to upserts in a single validation pass:
+FILE_UPSERTS_ADAPTER = TypeAdapter(list[models.FileMetadataUpsert])
+
 
 class EventSubTranslatorConfig(BaseSettings):
     """Config for receiving metadata on files to expect for upload."""
@@ -105,12 +110,14 @@ class EventSubTranslator(EventSubscriberProtocol):
             config.upload_accepted_event_topic,
             config.upload_rejected_event_topic,
         ]
-        self.types_of_interest = [
-            config.files_to_delete_type,
-            config.file_metadata_event_type,
-            config.upload_accepted_event_type,
-            config.upload_rejected_event_type,
-        ]
+        # map each event type to the method consuming it:
+        self._consumers_by_type: dict[str, Callable[..., Awaitable[None]]] = {
+            config.files_to_delete_type: self._consume_deletion_requested,
+            config.file_metadata_event_type: self._consume_file_metadata,
+            config.upload_accepted_event_type: self._consume_upload_accepted,
+            config.upload_rejected_event_type: self._consume_validation_failure,
+        }
+        self.types_of_interest = list(self._consumers_by_type)
 
         self._file_metadata_service = file_metadata_service
         self._upload_service = upload_service
@@ -122,15 +129,9 @@ class EventSubTranslator(EventSubscriberProtocol):
             payload=payload, schema=event_schemas.MetadataSubmissionUpserted
         )
 
-        file_upserts = [
-            models.FileMetadataUpsert(
-                file_id=file.file_id,
-                file_name=file.file_name,
-                decrypted_sha256=file.decrypted_sha256,
-                decrypted_size=file.decrypted_size,
-            )
-            for file in validated_payload.associated_files
-        ]
+        file_upserts = FILE_UPSERTS_ADAPTER.validate_python(
+            validated_payload.associated_files, from_attributes=True
+        )
 
         await self._file_metadata_service.upsert_multiple(files=file_upserts)
 
@@ -166,13 +167,9 @@ class EventSubTranslator(EventSubscriberProtocol):
         topic: Ascii,  # pylint: disable=unused-argument
     ) -> None:
         """Consume events from the topics of interest."""
-        if type_ == self._config.file_metadata_event_type:
-            await self._consume_file_metadata(payload=payload)
-        elif type_ == self._config.upload_accepted_event_type:
-            await self._consume_upload_accepted(payload=payload)
-        elif type_ == self._config.upload_rejected_event_type:
-            await self._consume_validation_failure(payload=payload)
-        elif type_ == self._config.files_to_delete_type:
-            await self._consume_deletion_requested(payload=payload)
-        else:
-            raise RuntimeError(f"Unexpected event of type: {type_}")
+        try:
+            consume = self._consumers_by_type[type_]
+        except KeyError as error:
+            raise RuntimeError(f"Unexpected event of type: {type_}") from error
+
+        await consume(payload=payload)
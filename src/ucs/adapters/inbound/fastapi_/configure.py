@@ -43,13 +43,7 @@ def get_configured_app(*, config: ApiConfigBase) -> FastAPI:
     app.include_router(router)
     configure_app(app, config=config)
 
-    def custom_openapi():
-        if app.openapi_schema:
-            return app.openapi_schema
-        openapi_schema = get_openapi_schema(app)
-        app.openapi_schema = openapi_schema
-        return app.openapi_schema
-
-    app.openapi = custom_openapi  # type: ignore [method-assign]
+    # generate the schema once upfront, FastAPI serves it from app.openapi_schema:
+    app.openapi_schema = get_openapi_schema(app)
 
     return app
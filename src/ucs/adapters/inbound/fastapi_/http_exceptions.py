@@ -15,8 +15,6 @@
 
 """A collextion of http exceptions."""
 
-import json
-
 from ghga_service_commons.httpyexpect.server import HttpCustomExceptionBase
 from pydantic import BaseModel
 
@@ -41,7 +39,7 @@ class HttpNoFileAccessError(HttpCustomExceptionBase):
             status_code=status_code,
             description=(
                 "The user is not registered as a Data Submitter for the file with"
-                + f" id {file_id}."
+                f" id {file_id}."
             ),
             data={"file_id": file_id},
         )
@@ -110,11 +108,11 @@ class HttpExistingActiveUploadError(HttpCustomExceptionBase):
             status_code=status_code,
             description=(
                 f"An upload attempt with status {active_upload.status.value} is already"
-                + "present for the file with ID {file_id}. Cannot create a new one."
+                f" present for the file with ID {file_id}. Cannot create a new one."
             ),
             data={
                 "file_id": file_id,
-                "active_upload": json.loads(active_upload.model_dump_json()),
+                "active_upload": active_upload.model_dump(mode="json"),
             },
         )
 
@@ -142,7 +140,7 @@ class HttpUploadNotPendingError(HttpCustomExceptionBase):
             status_code=status_code,
             description=(
                 f"The upload with ID {upload_id} has the status {current_status}"
-                + " and cannot be updated anymore."
+                " and cannot be updated anymore."
             ),
             data={
                 "upload_id": upload_id,
@@ -175,7 +173,7 @@ class HttpUploadStatusChangeError(HttpCustomExceptionBase):
             status_code=status_code,
             description=(
                 f"Failed to change the status of upload with id {upload_id} to"
-                + f" '{target_status}': {reason}"
+                f" '{target_status}': {reason}"
             ),
             data={"upload_id": upload_id, "target_status": target_status},
         )
@@ -15,13 +15,57 @@
 
 """DAO translators for accessing the database."""
 
+from collections.abc import AsyncIterator, Iterator, Sequence
 from dataclasses import dataclass
 
-from hexkit.protocols.dao import DaoFactoryProtocol
+from hexkit.providers.mongodb import MongoDbDaoFactory
 
 from ucs.core import models
 from ucs.ports.outbound.dao import DaoCollectionPort
 
+# upper bound for the number of IDs sent to the database in a single query, this
+# keeps the query documents well below the size limit of MongoDB:
+MAX_IDS_PER_QUERY = 1000
+
+
+def _chunked(ids: Sequence[str]) -> Iterator[list[str]]:
+    """Split the given IDs into lists of at most MAX_IDS_PER_QUERY elements."""
+    for start in range(0, len(ids), MAX_IDS_PER_QUERY):
+        yield list(ids[start : start + MAX_IDS_PER_QUERY])
+
+
+class DaoCollection(DaoCollectionPort):
+    """A collection of DAOs with lookups that rely on the MongoDB query language.
+    The DAOs have to be provided by the hexkit MongoDB provider.
+    """
+
+    async def find_file_metadata_by_ids(
+        self, file_ids: Sequence[str]
+    ) -> AsyncIterator[models.FileMetadata]:
+        """Find the metadata of all files with one of the given IDs. IDs of unknown
+        files are skipped.
+
+        The order of the returned metadata is not defined.
+        """
+        for chunk in _chunked(file_ids):
+            async for file in self.file_metadata.find_all(
+                mapping={"file_id": {"$in": chunk}}
+            ):
+                yield file
+
+    async def find_upload_attempts_by_object_ids(
+        self, object_ids: Sequence[str]
+    ) -> AsyncIterator[models.UploadAttempt]:
+        """Find all upload attempts that belong to one of the given object IDs.
+
+        The order of the returned attempts is not defined.
+        """
+        for chunk in _chunked(object_ids):
+            async for attempt in self.upload_attempts.find_all(
+                mapping={"object_id": {"$in": chunk}}
+            ):
+                yield attempt
+
 
 @dataclass
 class DaoCollectionTranslator:
@@ -30,9 +74,11 @@ class DaoCollectionTranslator:
     """
 
     @staticmethod
-    async def construct(*, provider: DaoFactoryProtocol) -> DaoCollectionPort:
-        """Setup a collection of DAOs using the specified provider of the
-        DaoFactoryProtocol.
+    async def construct(*, provider: MongoDbDaoFactory) -> DaoCollectionPort:
+        """Setup a collection of DAOs using the specified MongoDB DAO factory.
+
+        Only the MongoDB provider is accepted since the batched lookups of the
+        returned collection rely on the MongoDB query language.
         """
         file_metadata = await provider.get_dao(
             name="file_metadata", dto_model=models.FileMetadata, id_field="file_id"
@@ -41,6 +87,6 @@ class DaoCollectionTranslator:
             name="upload_attempts", dto_model=models.UploadAttempt, id_field="upload_id"
         )
 
-        return DaoCollectionPort(
+        return DaoCollection(
             file_metadata=file_metadata, upload_attempts=upload_attempts
         )
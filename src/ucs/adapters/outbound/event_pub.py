@@ -15,7 +15,6 @@
 
 """Kafka-based event publishing adapters and the exception they may throw."""
 
-import json
 from datetime import datetime
 
 from ghga_event_schemas import pydantic_ as event_schemas
@@ -89,7 +88,7 @@ class EventPubTranslator(EventPublisherPort):
         )
 
         await self._provider.publish(
-            payload=json.loads(event_payload.model_dump_json()),
+            payload=event_payload.model_dump(mode="json"),
             type_=self._config.upload_received_event_type,
             topic=self._config.upload_received_event_topic,
             key=file_metadata.file_id,
@@ -100,7 +99,7 @@ class EventPubTranslator(EventPublisherPort):
         event_payload = event_schemas.FileDeletionSuccess(file_id=file_id)
 
         await self._provider.publish(
-            payload=json.loads(event_payload.model_dump_json()),
+            payload=event_payload.model_dump(mode="json"),
             type_=self._config.file_deleted_event_type,
             topic=self._config.file_deleted_event_topic,
             key=file_id,
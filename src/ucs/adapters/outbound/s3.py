@@ -15,5 +15,34 @@
 
 """S3-based Implementation of object storage adapters."""
 
+from ghga_service_commons.utils.multinode_storage import (
+    S3ObjectStorages,
+    S3ObjectStoragesConfig,
+)
+
 # pylint: disable=unused-import
 from hexkit.providers.s3 import S3Config, S3ObjectStorage  # noqa: F401
+
+
+class CachingS3ObjectStorages(S3ObjectStorages):
+    """S3 specific multi node object storage instance that creates the object storage
+    for each alias only once and reuses it for all subsequent requests.
+
+    Creating an S3ObjectStorage sets up new boto3 clients, which is costly and prevents
+    reusing already established connections to the storage node.
+    """
+
+    def __init__(self, *, config: S3ObjectStoragesConfig):
+        super().__init__(config=config)
+        self._object_storages: dict[str, S3ObjectStorage] = {}
+
+    def for_alias(self, endpoint_alias: str) -> tuple[str, S3ObjectStorage]:
+        """Get bucket ID and object storage instance for a specific alias."""
+        node_config = self._config.object_storages[endpoint_alias]
+
+        object_storage = self._object_storages.get(endpoint_alias)
+        if object_storage is None:
+            object_storage = S3ObjectStorage(config=node_config.credentials)
+            self._object_storages[endpoint_alias] = object_storage
+
+        return node_config.bucket, object_storage
@@ -17,6 +17,7 @@
 """The main upload handling logic."""
 
 from collections.abc import Sequence
+from typing import Optional
 
 from ucs.core import models
 from ucs.ports.inbound.file_service import (
@@ -31,10 +32,11 @@ def _get_metadata_diff(
     b: models.FileMetadata,  # pylint: disable=invalid-name
 ) -> set[str]:
     """Check which fields differ between the metadata provided in a and b."""
-    a_dict = a.model_dump()
-    b_dict = b.model_dump()
-
-    return {field for field in a_dict if a_dict[field] != b_dict[field]}
+    return {
+        field
+        for field in models.FileMetadata.model_fields
+        if getattr(a, field) != getattr(b, field)
+    }
 
 
 class FileMetadataServive(FileMetadataServicePort):
@@ -62,15 +64,16 @@ class FileMetadataServive(FileMetadataServicePort):
                 file_id=existing_metadata.file_id, invalid_fields=not_allowed_field
             )
 
-    async def _insert_new(self, file: models.FileMetadataUpsert) -> None:
-        """Create a metadata entry for a new file."""
-        full_metadata = models.FileMetadata(**file.model_dump(), latest_upload_id=None)
+    async def _insert_new(self, file: models.FileMetadataUpsert) -> models.FileMetadata:
+        """Create a metadata entry for a new file and return it."""
+        full_metadata = models.FileMetadata(**dict(file), latest_upload_id=None)
         await self._daos.file_metadata.insert(full_metadata)
+        return full_metadata
 
     async def _update_existing(
         self, update: models.FileMetadataUpsert, existing_metadata: models.FileMetadata
-    ) -> None:
-        """Update the metadata for an existing file entry.
+    ) -> models.FileMetadata:
+        """Update the metadata for an existing file entry and return the result.
         Please note: not all metadata fields may be updated.
 
         Raises:
@@ -79,7 +82,7 @@ class FileMetadataServive(FileMetadataServicePort):
                 creation.
         """
         full_metadata = models.FileMetadata(
-            **update.model_dump(), latest_upload_id=existing_metadata.latest_upload_id
+            **dict(update), latest_upload_id=existing_metadata.latest_upload_id
         )
 
         self._assert_update_allowed(
@@ -87,6 +90,30 @@ class FileMetadataServive(FileMetadataServicePort):
         )
 
         await self._daos.file_metadata.update(full_metadata)
+        return full_metadata
+
+    async def _upsert(
+        self,
+        file: models.FileMetadataUpsert,
+        *,
+        existing_metadata: Optional[models.FileMetadata],
+    ) -> models.FileMetadata:
+        """Create a metadata entry for the given file if there is no existing entry,
+        otherwise update the existing one. The resulting metadata is returned.
+
+        Raises:
+            InvalidFileMetadataUpdateError:
+                When trying to update a metadata field, that can only be set on
+                creation.
+        """
+        if existing_metadata is None:
+            # there is no entry for that file in the database, yet => create it:
+            return await self._insert_new(file)
+
+        # there is an existing entry that might require updates:
+        return await self._update_existing(
+            update=file, existing_metadata=existing_metadata
+        )
 
     async def upsert_one(self, file: models.FileMetadataUpsert) -> None:
         """Register a new file or update the metadata for an existing one.
@@ -100,13 +127,9 @@ class FileMetadataServive(FileMetadataServicePort):
         try:
             existing_metadata = await self._daos.file_metadata.get_by_id(file.file_id)
         except ResourceNotFoundError:
-            # there is no entry for that file in the database, yet => create it:
-            await self._insert_new(file)
-        else:
-            # there is an existing entry that might require updates:
-            await self._update_existing(
-                update=file, existing_metadata=existing_metadata
-            )
+            existing_metadata = None
+
+        await self._upsert(file, existing_metadata=existing_metadata)
 
     async def upsert_multiple(self, files: Sequence[models.FileMetadataUpsert]) -> None:
         """Registers new files or updates the metadata for existing ones.
@@ -116,8 +139,18 @@ class FileMetadataServive(FileMetadataServicePort):
                 When trying to update a metadata field, that can only be set on
                 creation.
         """
+        # fetch existing entries in batches instead of one lookup per file:
+        existing_by_id = {
+            existing.file_id: existing
+            async for existing in self._daos.find_file_metadata_by_ids(
+                [file.file_id for file in files]
+            )
+        }
+
         for file in files:
-            await self.upsert_one(file)
+            existing_by_id[file.file_id] = await self._upsert(
+                file, existing_metadata=existing_by_id.get(file.file_id)
+            )
 
     async def get_by_id(
         self,
@@ -16,20 +16,31 @@
 """Functionality to periodically deal with stale files in configured object storage."""
 
 import logging
+from collections import defaultdict
+from collections.abc import Sequence
 
 from ghga_service_commons.utils.multinode_storage import (
     S3ObjectStorages,
     S3ObjectStoragesConfig,
 )
-from hexkit.protocols.dao import MultipleHitsFoundError, NoHitsFoundError
 
-from ucs.core.models import UploadStatus
+from ucs.core.models import UploadAttempt, UploadStatus
 from ucs.ports.inbound.storage_inspector import StorageInspectorPort
 from ucs.ports.inbound.upload_service import UploadServicePort
 from ucs.ports.outbound.dao import DaoCollectionPort
 
 log = logging.getLogger(__name__)
 
+# statuses after which no object should remain in the inbox:
+FINAL_UPLOAD_STATUSES = frozenset(
+    {
+        UploadStatus.ACCEPTED,
+        UploadStatus.CANCELLED,
+        UploadStatus.FAILED,
+        UploadStatus.REJECTED,
+    }
+)
+
 
 class InboxInspector(StorageInspectorPort):
     """Checks inbox storage buckets for stale files."""
@@ -45,6 +56,18 @@ class InboxInspector(StorageInspectorPort):
         self._daos = daos
         self._object_storages = object_storages
 
+    async def _get_attempts_by_object_id(
+        self, object_ids: Sequence[str]
+    ) -> dict[str, list[UploadAttempt]]:
+        """Fetch the upload attempts for all given object IDs and group them by
+        object ID.
+        """
+        attempts_by_object_id: dict[str, list[UploadAttempt]] = defaultdict(list)
+        async for attempt in self._daos.find_upload_attempts_by_object_ids(object_ids):
+            attempts_by_object_id[attempt.object_id].append(attempt)
+
+        return attempts_by_object_id
+
     async def check_buckets(self):
         """Check objects in all buckets configured for the service."""
         for storage_alias in self._config.object_storages:
@@ -54,31 +77,28 @@ class InboxInspector(StorageInspectorPort):
                 endpoint_alias=storage_alias
             )
             object_ids = await object_storage.list_all_object_ids(bucket_id=bucket_id)
+            attempts_by_object_id = await self._get_attempts_by_object_id(object_ids)
 
             for object_id in object_ids:
-                try:
-                    attempt = await self._daos.upload_attempts.find_one(
-                        mapping={"object_id": object_id}
-                    )
-                except (MultipleHitsFoundError, NoHitsFoundError) as error:
+                attempts = attempts_by_object_id.get(object_id, [])
+                if len(attempts) != 1:
                     # This service checks for inconsistencies elsewhere, so also check here
                     out_of_sync = UploadServicePort.StorageAndDatabaseOutOfSyncError(
-                        problem=f"Unexpected amount of hits in database for object {object_id}"
-                        + f" in storage identified by alias {storage_alias}."
+                        problem=(
+                            "Unexpected amount of hits in database for object"
+                            f" {object_id} in storage identified by alias"
+                            f" {storage_alias}."
+                        )
                     )
                     log.critical(
                         out_of_sync,
                         extra={"object_id": object_id, "storage_alias": storage_alias},
                     )
-                    raise out_of_sync from error
+                    raise out_of_sync
+                attempt = attempts[0]
 
                 # check if associated attempt status is one of the final statuses
-                if attempt.status in [
-                    UploadStatus.ACCEPTED,
-                    UploadStatus.CANCELLED,
-                    UploadStatus.FAILED,
-                    UploadStatus.REJECTED,
-                ]:
+                if attempt.status in FINAL_UPLOAD_STATUSES:
                     extra = {
                         "object_id": object_id,
                         "file_id": attempt.file_id,
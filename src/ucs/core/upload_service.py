@@ -36,6 +36,24 @@ from ucs.ports.outbound.event_pub import EventPublisherPort
 
 log = logging.getLogger(__name__)
 
+# statuses of upload attempts that prevent a new upload from being created:
+ACTIVE_UPLOAD_STATUSES = frozenset(
+    {
+        models.UploadStatus.ACCEPTED,
+        models.UploadStatus.PENDING,
+        models.UploadStatus.UPLOADED,
+    }
+)
+
+# statuses an upload attempt reaches after its interrogation outcome was processed:
+PROCESSED_UPLOAD_STATUSES = frozenset(
+    {
+        models.UploadStatus.ACCEPTED,
+        models.UploadStatus.FAILED,
+        models.UploadStatus.REJECTED,
+    }
+)
+
 
 class UploadService(UploadServicePort):
     """Service for handling multi-part uploads to the Inbox storage."""
@@ -110,11 +128,31 @@ class UploadService(UploadServicePort):
             multipart_cancel_error = self.UploadCancelError(upload_id=upload_id)
             log.error(multipart_cancel_error, extra={"upload_id": upload_id})
             raise multipart_cancel_error from error
-        except object_storage.MultiPartUploadNotFoundError:
+        except object_storage.MultiPartUploadNotFoundError as error:
             # This correspond to an inconsistency between the database and
             # the storage, however, since this cancel method might be used to
             # resolve this inconsistency, this exception will be ignored.
-            pass
+            # But the multipart upload might also have been completed
+            # concurrently, e.g. by another instance of this service, which might
+            # not have updated the database yet. The object storage is the source
+            # of truth in that case, so never overwrite the outcome of a completion:
+            if await object_storage.does_object_exist(
+                bucket_id=bucket_id, object_id=upload.object_id
+            ):
+                status_mismatch_error = self.UploadStatusMismatchError(
+                    upload_id=upload_id,
+                    expected_status=models.UploadStatus.PENDING,
+                    current_status=models.UploadStatus.UPLOADED,
+                )
+                log.error(
+                    status_mismatch_error,
+                    extra={
+                        "upload_id": upload_id,
+                        "expected_status": models.UploadStatus.PENDING,
+                        "current_status": models.UploadStatus.UPLOADED,
+                    },
+                )
+                raise status_mismatch_error from error
 
         # change the final status of the upload in the database:
         updated_upload = upload.model_copy(update={"status": final_status})
@@ -161,11 +199,7 @@ class UploadService(UploadServicePort):
                     "current_status": current_status,
                 },
             )
-            if current_status in (
-                models.UploadStatus.ACCEPTED,
-                models.UploadStatus.FAILED,
-                models.UploadStatus.REJECTED,
-            ):
+            if current_status in PROCESSED_UPLOAD_STATUSES:
                 # This state can be reached when consuming an event that has already
                 # been seen, i.e. this does not necessarily represent an inconsistency
                 # so simply abort processing here
@@ -195,9 +229,9 @@ class UploadService(UploadServicePort):
             db_storage_not_synchronized = self.StorageAndDatabaseOutOfSyncError(
                 problem=(
                     f"Trying to clear the upload with ID {latest_upload.upload_id}"
-                    + f" for file with file ID {file_id} (final status: {final_status}),"
-                    + " however, the corresponding file with object ID"
-                    + f" {latest_upload.object_id} could not be found in object storage."
+                    f" for file with file ID {file_id} (final status: {final_status}),"
+                    " however, the corresponding file with object ID"
+                    f" {latest_upload.object_id} could not be found in object storage."
                 )
             )
             log.critical(
@@ -228,11 +262,7 @@ class UploadService(UploadServicePort):
             mapping={"file_id": file_id}
         )
         async for attempt in existing_attempts:
-            if attempt.status in (
-                models.UploadStatus.ACCEPTED,
-                models.UploadStatus.PENDING,
-                models.UploadStatus.UPLOADED,
-            ):
+            if attempt.status in ACTIVE_UPLOAD_STATUSES:
                 active_upload_exists = self.ExistingActiveUploadError(
                     active_upload=attempt
                 )
@@ -413,8 +443,8 @@ class UploadService(UploadServicePort):
             db_storage_not_synchronized = self.StorageAndDatabaseOutOfSyncError(
                 problem=(
                     f"The upload attempt with ID {upload_id} was marked as 'pending' in"
-                    + "the database, but no corresponding upload exists in the object"
-                    + "storage."
+                    " the database, but no corresponding upload exists in the object"
+                    " storage."
                 )
             )
             log.error(
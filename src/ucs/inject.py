@@ -21,7 +21,6 @@ from typing import Optional
 
 from fastapi import FastAPI
 from ghga_service_commons.utils.context import asyncnullcontext
-from ghga_service_commons.utils.multinode_storage import S3ObjectStorages
 from hexkit.providers.akafka import KafkaEventPublisher, KafkaEventSubscriber
 from hexkit.providers.mongodb import MongoDbDaoFactory
 
@@ -30,6 +29,7 @@ from ucs.adapters.inbound.fastapi_ import dummies
 from ucs.adapters.inbound.fastapi_.configure import get_configured_app
 from ucs.adapters.outbound.dao import DaoCollectionTranslator
 from ucs.adapters.outbound.event_pub import EventPubTranslator
+from ucs.adapters.outbound.s3 import CachingS3ObjectStorages
 from ucs.config import Config
 from ucs.core.file_service import FileMetadataServive
 from ucs.core.storage_inspector import InboxInspector
@@ -44,7 +44,7 @@ async def prepare_core(
     config: Config,
 ) -> AsyncGenerator[tuple[UploadServicePort, FileMetadataServicePort], None]:
     """Constructs and initializes all core components and their outbound dependencies."""
-    object_storages = S3ObjectStorages(config=config)
+    object_storages = CachingS3ObjectStorages(config=config)
     dao_factory = MongoDbDaoFactory(config=config)
     dao_collection = await DaoCollectionTranslator.construct(provider=dao_factory)
 
@@ -127,7 +127,7 @@ async def prepare_event_subscriber(
 @asynccontextmanager
 async def prepare_storage_inspector(*, config: Config):
     """Alternative to prepare_core for storage inspection CLI command without Kafka."""
-    object_storages = S3ObjectStorages(config=config)
+    object_storages = CachingS3ObjectStorages(config=config)
     dao_factory = MongoDbDaoFactory(config=config)
     dao_collection = await DaoCollectionTranslator.construct(provider=dao_factory)
 
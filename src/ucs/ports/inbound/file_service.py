@@ -42,9 +42,10 @@ class FileMetadataServicePort(ABC):
 
         def __init__(self, *, file_id: str, invalid_fields: Iterable[str]):
             self.file_id = file_id
+            fields = ", ".join(invalid_fields)
             message = (
-                f"Following fields for the with ID {file_id} cannot be updated: "
-                + ", ".join(invalid_fields)
+                f"Following fields for the file with ID {file_id} cannot be updated:"
+                f" {fields}"
             )
             super().__init__(message)
 
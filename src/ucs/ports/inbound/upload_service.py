@@ -52,8 +52,8 @@ class UploadServicePort(ABC):
             self.current_status = current_status
             message = (
                 f"The upload with ID {upload_id} must be in '{expected_status}' state to"
-                + " perform the requested action, however, its current state is:"
-                + str(current_status)
+                " perform the requested action, however, its current state is:"
+                f" {current_status}"
             )
             super().__init__(message)
 
@@ -64,10 +64,10 @@ class UploadServicePort(ABC):
             self.active_upload = active_upload
             message = (
                 "Failed to create a new multi-part upload for the file with ID"
-                + f" {self.active_upload.file_id} because another upload is"
-                + " currently active or has been accepted."
-                + f" ID, status of the existing upload: {self.active_upload.upload_id},"
-                + f" {self.active_upload.status}"
+                f" {active_upload.file_id} because another upload is"
+                " currently active or has been accepted."
+                f" ID, status of the existing upload: {active_upload.upload_id},"
+                f" {active_upload.status}"
             )
             super().__init__(message)
 
@@ -79,8 +79,8 @@ class UploadServicePort(ABC):
             self.upload_id = upload_id
             message = (
                 f"The confirmation of the upload attempt with ID {upload_id} failed."
-                + " The upload attempt was aborted and cannot be resumed. The reason was: "
-                + reason
+                " The upload attempt was aborted and cannot be resumed. The reason was:"
+                f" {reason}"
             )
             super().__init__(message)
 
@@ -91,11 +91,11 @@ class UploadServicePort(ABC):
             self.upload_id = upload_id
             self.possible_reason = (
                 "An ongoing part upload might be a reason. Please complete all part uploads"
-                + " and try to cancel again."
+                " and try to cancel again."
             )
             message = (
                 f"Failed to cancel the multi-part upload {upload_id}."
-                + self.possible_reason
+                f" {self.possible_reason}"
             )
             super().__init__(message)
 
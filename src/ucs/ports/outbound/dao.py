@@ -15,6 +15,8 @@
 
 """DAO translators for accessing the database."""
 
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
 
 # for convienience: forward errors that may be thrown by DAO instances:
@@ -29,8 +31,29 @@ from ucs.core import models
 
 
 @dataclass
-class DaoCollectionPort:
+class DaoCollectionPort(ABC):
     """A collection of DAOs for interacting with the database."""
 
     file_metadata: DaoNaturalId[models.FileMetadata]
     upload_attempts: DaoNaturalId[models.UploadAttempt]
+
+    @abstractmethod
+    def find_file_metadata_by_ids(
+        self, file_ids: Sequence[str]
+    ) -> AsyncIterator[models.FileMetadata]:
+        """Find the metadata of all files with one of the given IDs. IDs of unknown
+        files are skipped.
+
+        The order of the returned metadata is not defined.
+        """
+        ...
+
+    @abstractmethod
+    def find_upload_attempts_by_object_ids(
+        self, object_ids: Sequence[str]
+    ) -> AsyncIterator[models.UploadAttempt]:
+        """Find all upload attempts that belong to one of the given object IDs.
+
+        The order of the returned attempts is not defined.
+        """
+        ...
@@ -19,15 +19,22 @@ Note: This test module uses the module-scoped fixtures.
 """
 
 import json
+import logging
 from contextlib import suppress
 
 import pytest
 from fastapi import status
 from ghga_event_schemas import pydantic_ as event_schemas
 from hexkit.protocols.dao import ResourceNotFoundError
-from hexkit.providers.s3.testutils import upload_part_via_url
-
-from tests.fixtures.example_data import UPLOAD_DETAILS_1, UPLOAD_DETAILS_2
+from hexkit.providers.s3.testutils import temp_file_object, upload_part_via_url
+
+from tests.fixtures.example_data import (
+    EXAMPLE_FILE_1,
+    EXAMPLE_FILE_2,
+    EXAMPLE_UPLOAD_1,
+    UPLOAD_DETAILS_1,
+    UPLOAD_DETAILS_2,
+)
 from tests.fixtures.module_scope_fixtures import (  # noqa: F401
     JointFixture,
     joint_fixture,
@@ -37,7 +44,9 @@ from tests.fixtures.module_scope_fixtures import (  # noqa: F401
     s3_fixture,
     second_s3_fixture,
 )
+from ucs.adapters.outbound import dao as dao_adapter
 from ucs.core import models
+from ucs.ports.inbound.upload_service import UploadServicePort
 
 
 async def create_multipart_upload_with_data(
@@ -331,6 +340,90 @@ async def test_create_presigned_url_not_found(
     assert response.json()["exception_id"] == "noSuchUpload"
 
 
+@pytest.mark.asyncio(scope="module")
+async def test_cancel_after_complete(
+    joint_fixture: JointFixture,  # noqa: F811
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that cancelling an upload that was completed in the meantime does not
+    overwrite its status, also if the cancel request still read the upload as pending
+    (e.g. when both requests are handled by different instances of the service).
+    """
+    file_id = UPLOAD_DETAILS_1.submission_metadata.file_id
+    await create_multipart_upload_with_data(
+        joint_fixture=joint_fixture,
+        file_to_register=UPLOAD_DETAILS_1.submission_metadata,
+        storage_alias=UPLOAD_DETAILS_1.storage_alias,
+    )
+    pending_upload = await joint_fixture.daos.upload_attempts.find_one(
+        mapping={"file_id": file_id}
+    )
+    upload_id = pending_upload.upload_id
+
+    response = await joint_fixture.rest_client.patch(
+        f"/uploads/{upload_id}", json={"status": models.UploadStatus.UPLOADED.value}
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    # a subsequent cancel request is rejected:
+    response = await joint_fixture.rest_client.patch(
+        f"/uploads/{upload_id}", json={"status": models.UploadStatus.CANCELLED.value}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["exception_id"] == "uploadNotPending"
+
+    # simulate a cancel request that read the upload before it was completed:
+    upload_service = joint_fixture.upload_service
+    get_details = upload_service.get_details
+    stale_reads = [pending_upload]
+
+    async def get_details_with_stale_read(*, upload_id: str) -> models.UploadAttempt:
+        if stale_reads:
+            return stale_reads.pop()
+        return await get_details(upload_id=upload_id)
+
+    monkeypatch.setattr(upload_service, "get_details", get_details_with_stale_read)
+
+    with pytest.raises(UploadServicePort.UploadStatusMismatchError):
+        await upload_service.cancel(upload_id=upload_id)
+
+    upload = await joint_fixture.daos.upload_attempts.get_by_id(upload_id)
+    assert upload.status == models.UploadStatus.UPLOADED
+
+
+@pytest.mark.asyncio(scope="module")
+async def test_cancel_during_complete(joint_fixture: JointFixture):  # noqa: F811
+    """Test that cancelling an upload fails if the multipart upload was already
+    completed in the object storage but the database still lists it as pending,
+    e.g. when the completion is still ongoing in another instance of the service.
+    """
+    file_id = UPLOAD_DETAILS_1.submission_metadata.file_id
+    object_id = await create_multipart_upload_with_data(
+        joint_fixture=joint_fixture,
+        file_to_register=UPLOAD_DETAILS_1.submission_metadata,
+        storage_alias=UPLOAD_DETAILS_1.storage_alias,
+    )
+    pending_upload = await joint_fixture.daos.upload_attempts.find_one(
+        mapping={"file_id": file_id}
+    )
+    upload_id = pending_upload.upload_id
+
+    # complete the multipart upload only in the object storage:
+    await joint_fixture.s3.storage.complete_multipart_upload(
+        upload_id=upload_id, bucket_id=joint_fixture.bucket_id, object_id=object_id
+    )
+
+    with pytest.raises(UploadServicePort.UploadStatusMismatchError):
+        await joint_fixture.upload_service.cancel(upload_id=upload_id)
+
+    # neither the object nor the status of the upload have been touched:
+    assert await joint_fixture.s3.storage.does_object_exist(
+        bucket_id=joint_fixture.bucket_id, object_id=object_id
+    )
+    upload = await joint_fixture.daos.upload_attempts.get_by_id(upload_id)
+    assert upload.status == models.UploadStatus.PENDING
+
+
 @pytest.mark.asyncio(scope="module")
 async def test_deletion_upload_ongoing(joint_fixture: JointFixture):  # noqa: F811
     """Test file data deletion while upload is still ongoing.
@@ -405,3 +498,123 @@ async def test_deletion_upload_ongoing(joint_fixture: JointFixture):  # noqa: F8
         ):
             num_attempts += 1
         assert num_attempts == 0
+
+
+@pytest.mark.asyncio(scope="module")
+async def test_upsert_multiple_mixed(joint_fixture: JointFixture):  # noqa: F811
+    """Test registering a batch of file metadata that contains already registered,
+    new, and repeated files.
+    """
+    await joint_fixture.daos.file_metadata.insert(EXAMPLE_FILE_1)
+
+    new_file = models.FileMetadataUpsert(**EXAMPLE_FILE_2.model_dump())
+    await joint_fixture.file_metadata_service.upsert_multiple(
+        [
+            models.FileMetadataUpsert(**EXAMPLE_FILE_1.model_dump()),
+            new_file,
+            new_file,
+        ]
+    )
+
+    # the existing entry is left untouched, including its latest upload:
+    assert (
+        await joint_fixture.daos.file_metadata.get_by_id(EXAMPLE_FILE_1.file_id)
+        == EXAMPLE_FILE_1
+    )
+    # the new entry is created once, without an upload:
+    assert await joint_fixture.daos.file_metadata.get_by_id(
+        EXAMPLE_FILE_2.file_id
+    ) == EXAMPLE_FILE_2.model_copy(update={"latest_upload_id": None})
+
+
+async def put_inbox_objects(
+    joint_fixture: JointFixture,  # noqa: F811
+    object_ids: list[str],
+):
+    """Put small objects with the given IDs into the bucket of the first storage."""
+    for object_id in object_ids:
+        with temp_file_object(
+            bucket_id=joint_fixture.bucket_id, object_id=object_id, size=1024
+        ) as file_object:
+            await joint_fixture.s3.populate_file_objects([file_object])
+
+
+@pytest.mark.asyncio(scope="module")
+async def test_inbox_inspector_chunked_lookups(
+    caplog,
+    joint_fixture: JointFixture,  # noqa: F811
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that the inbox inspector finds the upload attempts of all objects when
+    they have to be looked up in several queries.
+    """
+    monkeypatch.setattr(dao_adapter, "MAX_IDS_PER_QUERY", 1)
+
+    object_ids = [f"object00{number}" for number in range(1, 4)]
+    attempts = [
+        EXAMPLE_UPLOAD_1.model_copy(
+            update={
+                "upload_id": f"testUpload00{number}",
+                "object_id": object_id,
+                "status": models.UploadStatus.REJECTED,
+            }
+        )
+        for number, object_id in enumerate(object_ids, start=1)
+    ]
+    for attempt in attempts:
+        await joint_fixture.daos.upload_attempts.insert(attempt)
+    await put_inbox_objects(joint_fixture, object_ids)
+
+    # every ID is looked up in a query of its own:
+    find_all = joint_fixture.daos.upload_attempts.find_all
+    mappings = []
+
+    def find_all_spy(*, mapping):
+        mappings.append(mapping)
+        return find_all(mapping=mapping)
+
+    monkeypatch.setattr(joint_fixture.daos.upload_attempts, "find_all", find_all_spy)
+    found = [
+        attempt
+        async for attempt in joint_fixture.daos.find_upload_attempts_by_object_ids(
+            object_ids
+        )
+    ]
+    assert sorted(attempt.upload_id for attempt in found) == [
+        attempt.upload_id for attempt in attempts
+    ]
+    assert mappings == [{"object_id": {"$in": [object_id]}} for object_id in object_ids]
+
+    # all objects are reported as stale:
+    caplog.clear()
+    caplog.set_level(level=logging.INFO, logger="ucs.core.storage_inspector")
+    await joint_fixture.inbox_inspector.check_buckets()
+
+    for attempt in attempts:
+        expected_message = (
+            f"Stale object '{attempt.object_id}' found for file '{attempt.file_id}'"
+            f" in bucket '{joint_fixture.bucket_id}' of storage"
+            f" '{attempt.storage_alias}'."
+        )
+        assert expected_message in caplog.messages
+    assert len(caplog.messages) == len(attempts)
+
+
+@pytest.mark.parametrize("number_of_attempts", [0, 2])
+@pytest.mark.asyncio(scope="module")
+async def test_inbox_inspector_out_of_sync(
+    number_of_attempts: int,
+    joint_fixture: JointFixture,  # noqa: F811
+):
+    """Test that the inbox inspector fails for an object that does not have exactly
+    one upload attempt.
+    """
+    object_id = EXAMPLE_UPLOAD_1.object_id
+    for number in range(1, number_of_attempts + 1):
+        await joint_fixture.daos.upload_attempts.insert(
+            EXAMPLE_UPLOAD_1.model_copy(update={"upload_id": f"testUpload00{number}"})
+        )
+    await put_inbox_objects(joint_fixture, [object_id])
+
+    with pytest.raises(UploadServicePort.StorageAndDatabaseOutOfSyncError):
+        await joint_fixture.inbox_inspector.check_buckets()
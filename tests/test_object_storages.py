@@ -0,0 +1,57 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the caching of object storages per storage alias."""
+
+import pytest
+from ghga_service_commons.utils.multinode_storage import S3ObjectStoragesConfig
+
+from ucs.adapters.outbound.s3 import CachingS3ObjectStorages
+
+CREDENTIALS = {
+    "s3_endpoint_url": "http://localhost:4566",
+    "s3_access_key_id": "test",
+    "s3_secret_access_key": "test",
+}
+CONFIG = S3ObjectStoragesConfig(
+    object_storages={
+        "test": {"bucket": "test-inbox", "credentials": CREDENTIALS},
+        "test2": {"bucket": "test-inbox-2", "credentials": CREDENTIALS},
+    }
+)
+
+
+def test_for_alias_reuses_object_storage():
+    """Test that repeated calls for one alias return the same object storage, while
+    different aliases get different ones.
+    """
+    object_storages = CachingS3ObjectStorages(config=CONFIG)
+
+    bucket_id, object_storage = object_storages.for_alias("test")
+    bucket_id_again, object_storage_again = object_storages.for_alias("test")
+    bucket_id_2, object_storage_2 = object_storages.for_alias("test2")
+
+    assert bucket_id == bucket_id_again == "test-inbox"
+    assert object_storage_again is object_storage
+    assert bucket_id_2 == "test-inbox-2"
+    assert object_storage_2 is not object_storage
+
+
+def test_for_alias_unknown():
+    """Test that requesting an unknown alias still raises a KeyError."""
+    object_storages = CachingS3ObjectStorages(config=CONFIG)
+
+    with pytest.raises(KeyError):
+        object_storages.for_alias("unknown")